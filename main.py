@@ -1,21 +1,13 @@
 import asyncio
 import sys
-import yaml
 from logging import Logger, StreamHandler, getLogger
 
 
 from core.modules.engine import ModuleEngine
+from core.modules.util import FileSystem
 from core.util.logging import configure_logging
 
 
-def load_configuration(config_path: str) -> dict:
-    """
-    Load the configuration from the YAML file.
-    """
-    with open(config_path, "r") as file:
-        return yaml.safe_load(file)
-
-
 class Main:
     _logger: Logger
 
@@ -23,7 +15,7 @@ class Main:
         self._logger = logger
 
         # Load configuration
-        config = load_configuration("src/settings/configuration.yaml")
+        config = FileSystem.load_configuration()
         log_level = config["logging"]["level"]
 
         # Initialize the ModuleEngine with the correct log level
@@ -20,7 +20,6 @@ from core.modules.engine.engine_core import ModuleEngine
 from core.util.logging import configure_logging
 from core.modules.util import FileSystem
 from core.security.utils import (
-    verify_module,
     get_public_key,
     get_module_verification_status,
     configure_security_from_args,
@@ -40,7 +39,7 @@ from core.util.version_utils import (
 from core.constants import DEFAULT_VERSION
 
 from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.asymmetric import ed25519, padding, rsa
 
 # Create Typer app
 app = typer.Typer(
@@ -81,6 +80,13 @@ class ListType(str, Enum):
     PIPELINES = "pipelines"
 
 
+class KeyType(str, Enum):
+    """Enum for signing key types"""
+
+    RSA = "rsa"
+    ED25519 = "ed25519"
+
+
 def print_styled(
     message: str, style: str = "green", bold: bool = False, panel: bool = False
 ):
@@ -327,7 +333,22 @@ def list_modules(filter_str: str = ""):
         print_styled("Modules directory not found!", style="red", bold=True)
         return
 
-    # Get verification status for all modules
+    # Get module directories that will actually be listed
+    with os.scandir(modules_directory_str) as entries:
+        module_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+    if not module_dirs:
+        print_styled("No modules found!", style="yellow", bold=True)
+        return
+
+    listed_dirs = [
+        module_dir
+        for module_dir in module_dirs
+        if not (filter_str and filter_str.lower() not in module_dir.name.lower())
+        and (module_dir / "module.yaml").exists()
+    ]
+
+    # Get verification status for all listed modules
     public_key = get_public_key()
     if not public_key:
         print_styled(
@@ -335,34 +356,21 @@ def list_modules(filter_str: str = ""):
         )
         verification_status = {}
     else:
-        # Check verification status for all modules
-        verification_status = {}
-        for item in os.listdir(modules_directory_str):
-            module_path = os.path.join(modules_directory_str, item)
-            if os.path.isdir(module_path):
-                verification_status[item] = verify_module(module_path, public_key)
-
-    # Get module directories
-    module_dirs = [d for d in modules_directory.iterdir() if d.is_dir()]
-
-    if not module_dirs:
-        print_styled("No modules found!", style="yellow", bold=True)
-        return
+        # Check verification status for all modules concurrently
+        results = module_security_manager.verify_modules(
+            [str(module_dir) for module_dir in listed_dirs]
+        )
+        verification_status = {
+            Path(path).name: status == ModuleVerificationStatus.VERIFIED
+            for path, (status, _) in results.items()
+        }
 
-    for module_dir in sorted(module_dirs):
+    for module_dir in sorted(listed_dirs):
         module_name = module_dir.name
-
-        # Apply filter if specified
-        if filter_str and filter_str.lower() not in module_name.lower():
-            continue
-
         yaml_file = module_dir / "module.yaml"
-        if not yaml_file.exists():
-            continue
 
         try:
-            with open(yaml_file, "r") as f:
-                module_data = yaml.safe_load(f)
+            module_data = FileSystem.load_yaml(str(yaml_file))
 
             name = module_data.get("name", module_name)
             version = module_data.get("version", "Unknown")
@@ -659,13 +667,17 @@ def sign_module_command(
 
         # Sign the hash
         module_hash_bytes = module_hash.encode("utf-8")
-        signature = private_key.sign(
-            module_hash_bytes,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256(),
-        )
+        if isinstance(private_key, ed25519.Ed25519PrivateKey):
+            signature = private_key.sign(module_hash_bytes)
+        else:
+            signature = private_key.sign(
+                module_hash_bytes,
+                padding.PSS(
+                    mgf=padding.MGF1(hashes.SHA256()),
+                    salt_length=padding.PSS.MAX_LENGTH,
+                ),
+                hashes.SHA256(),
+            )
 
         # Determine signature path
         sig_path = output_path if output_path else module_path / "module.sig"
@@ -732,7 +744,7 @@ def verify_module_command(
                 print_styled("No signature file found", style="yellow")
 
             # Show module hash
-            module_hash = module_security_manager.compute_module_hash(str(module_path))
+            module_hash = module_security_manager.get_module_hash(str(module_path))
             if module_hash:
                 print_styled("Module hash:", style="blue")
                 print(f"  {module_hash}")
@@ -837,8 +849,15 @@ def generate_keypair_command(
     prefix: str = typer.Option(
         "eidolon", "--prefix", "-p", help="Prefix for key filenames"
     ),
+    key_type: KeyType = typer.Option(
+        KeyType.RSA,
+        "--type",
+        "-t",
+        case_sensitive=False,
+        help="Key type to generate",
+    ),
     key_size: int = typer.Option(
-        2048, "--size", "-s", help="Key size in bits (2048, 3072, or 4096)"
+        2048, "--size", "-s", help="RSA key size in bits (2048, 3072, or 4096)"
     ),
     with_password: bool = typer.Option(
         True,
@@ -846,21 +865,25 @@ def generate_keypair_command(
         help="Whether to password-protect the private key",
     ),
 ):
-    """Generate a new RSA keypair for signing modules."""
+    """Generate a new RSA or Ed25519 keypair for signing modules."""
     try:
         # Validate key size
-        if key_size not in (2048, 3072, 4096):
+        if key_type == KeyType.RSA and key_size not in (2048, 3072, 4096):
             print_styled(
                 "Key size must be 2048, 3072, or 4096 bits.", style="red", bold=True
             )
             return typer.Exit(1)
 
         # Generate key pair
-        print_styled(f"Generating {key_size}-bit RSA keypair...", style="blue")
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=key_size,
-        )
+        if key_type == KeyType.ED25519:
+            print_styled("Generating Ed25519 keypair...", style="blue")
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        else:
+            print_styled(f"Generating {key_size}-bit RSA keypair...", style="blue")
+            private_key = rsa.generate_private_key(
+                public_exponent=65537,
+                key_size=key_size,
+            )
 
         # Get password if needed
         password = None
@@ -1,23 +1,32 @@
-from logging import Logger
-from typing import Optional, List, Dict, Any, Callable
+from logging import DEBUG, Logger
+from typing import Optional, Dict, Any, Callable
 import asyncio
 import inspect
 import os
+import sys
 import yaml
 import traceback
 from datetime import datetime
 
 from ..models import Meta, Device, CourierEnvelope
+from ..util.helpers import FileSystem
 from ..util.messagebus import MessageBus
 
 
 class IModuleRegistry(type):
-    module_registries: List[type] = list()
+    # Registered module classes keyed by "<module>.<class name>", in registration order
+    module_registries: Dict[str, type] = dict()
 
     def __init__(cls, name, bases, attrs):
         super().__init__(name, bases, attrs)
+        # Resolve the defining file once per class rather than via inspect on each lookup
+        module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        cls._module_dir = os.path.dirname(module_file) if module_file else None
         if name != "ModuleCore":
-            IModuleRegistry.module_registries.append(cls)
+            key = f"{cls.__module__}.{name}"
+            # Re-registering (e.g. on reload) replaces the old class and moves it to the end
+            IModuleRegistry.module_registries.pop(key, None)
+            IModuleRegistry.module_registries[key] = cls
 
 
 class ModuleCore(object, metaclass=IModuleRegistry):
@@ -58,17 +67,16 @@ class ModuleCore(object, metaclass=IModuleRegistry):
 
         # Load metadata from module.yaml
         try:
-            config_path = os.path.join(
-                os.path.dirname(inspect.getfile(self.__class__)), "module.yaml"
+            # A private copy: the parsed file is cached and shared between instances
+            config_data = FileSystem.load_configuration(
+                "module.yaml", self._module_directory()
+            )
+            self._config = config_data
+            self.meta = Meta(
+                name=config_data.get("name", self.__class__.__name__),
+                description=config_data.get("description", "No description"),
+                version=config_data.get("version", "0.0.0"),
             )
-            with open(config_path, "r", encoding="utf-8") as file:
-                config_data = yaml.safe_load(file)
-                self._config = config_data
-                self.meta = Meta(
-                    name=config_data.get("name", self.__class__.__name__),
-                    description=config_data.get("description", "No description"),
-                    version=config_data.get("version", "0.0.0"),
-                )
         except FileNotFoundError:
             self.meta = Meta(
                 name=self.__class__.__name__,
@@ -76,7 +84,8 @@ class ModuleCore(object, metaclass=IModuleRegistry):
                 version="0.0.0",
             )
             self._logger.warning(
-                f"module.yaml file not found for {self.__class__.__name__}. Using default values."
+                "module.yaml file not found for %s. Using default values.",
+                self.__class__.__name__,
             )
         except Exception as e:
             self.meta = Meta(
@@ -84,11 +93,17 @@ class ModuleCore(object, metaclass=IModuleRegistry):
                 description="Error loading module configuration",
                 version="0.0.0",
             )
-            self._logger.error(f"Failed to load module configuration: {e}")
+            self._logger.error("Failed to load module configuration: %s", e)
 
         # No longer immediately initialize - init() will be called after security verification
         # by the initialize_module() method
 
+    def _module_directory(self) -> str:
+        """Get the directory containing this module's module.yaml file."""
+        if self._module_dir is not None:
+            return self._module_dir
+        return os.path.dirname(inspect.getfile(self.__class__))
+
     def initialize_module(self) -> None:
         """
         Initialize the module after security verification.
@@ -105,18 +120,19 @@ class ModuleCore(object, metaclass=IModuleRegistry):
         if self._config is not None:
             return self._config
 
-        module_dir = os.path.dirname(inspect.getfile(self.__class__))
-        config_path = os.path.join(module_dir, "module.yaml")
+        module_dir = self._module_directory()
 
         try:
-            with open(config_path, "r") as file:
-                self._config = yaml.safe_load(file)
-                return self._config
+            self._config = FileSystem.load_configuration("module.yaml", module_dir)
+            return self._config
         except FileNotFoundError:
-            self._logger.error(f"Configuration file not found: {config_path}")
+            self._logger.error(
+                "Configuration file not found: %s",
+                os.path.join(module_dir, "module.yaml"),
+            )
             raise
         except yaml.YAMLError as e:
-            self._logger.error(f"Error parsing configuration file: {e}")
+            self._logger.error("Error parsing configuration file: %s", e)
             raise
 
     def handle_input(self, envelope: CourierEnvelope) -> None:
@@ -124,12 +140,19 @@ class ModuleCore(object, metaclass=IModuleRegistry):
         Handle input data from the message bus, wrapped in a CourierEnvelope.
         """
         try:
-            # Log receipt of data with metadata
-            self._logger.debug(
-                f"Received data from topic '{envelope.topic}'"
-                f"{f' from {envelope.source_module}' if envelope.source_module else ''}"
-                f" ({type(envelope.data).__name__})"
-            )
+            # Log receipt of data with metadata; this runs for every message, so
+            # skip building the arguments unless debug logging is on
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug(
+                    "Received data from topic '%s'%s (%s)",
+                    envelope.topic,
+                    (
+                        f" from {envelope.source_module}"
+                        if envelope.source_module
+                        else ""
+                    ),
+                    type(envelope.data).__name__,
+                )
 
             # Signal that new input has been received (for reactive mode)
             if self._run_mode == "reactive":
@@ -139,7 +162,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
             self.process(envelope)
 
         except Exception as e:
-            self._logger.error(f"Error handling input in {self.meta.name}: {e}")
+            self._logger.error("Error handling input in %s: %s", self.meta.name, e)
             self._logger.debug(traceback.format_exc())
 
     async def run(self, message_bus: MessageBus) -> None:
@@ -159,7 +182,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
                     await self.execute(message_bus)
                     self._is_completed = True
                 except Exception as e:
-                    self._logger.error(f"Error in {self.meta.name} execution: {e}")
+                    self._logger.error("Error in %s execution: %s", self.meta.name, e)
                     self._logger.debug(traceback.format_exc())
                     self._is_completed = True
 
@@ -167,15 +190,27 @@ class ModuleCore(object, metaclass=IModuleRegistry):
                 await self._reactive_loop(message_bus)
 
             else:  # "loop" mode
+                loop = asyncio.get_running_loop()
+                next_cycle = loop.time()
                 while not self._shutdown_event.is_set():
                     try:
                         await self.execute(message_bus)
 
+                        # Schedule cycles on the loop's monotonic clock so time spent
+                        # in execute() doesn't accumulate as drift. If a cycle overran,
+                        # start the next one straight away instead of bursting to catch up
+                        next_cycle = max(next_cycle + self.cycle_time(), loop.time())
+                        delay = next_cycle - loop.time()
+
+                        # Already due: just yield to the loop rather than arming a timer
+                        if delay <= 0:
+                            await asyncio.sleep(0)
+                            continue
+
                         # Wait before next cycle
                         try:
                             await asyncio.wait_for(
-                                self._shutdown_event.wait(),
-                                timeout=self.cycle_time(),
+                                self._shutdown_event.wait(), timeout=delay
                             )
                         except asyncio.TimeoutError:
                             # Normal timeout, continue to next cycle
@@ -183,7 +218,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
                     except asyncio.CancelledError:
                         break
                     except Exception as e:
-                        self._logger.error(f"Error in {self.meta.name} cycle: {e}")
+                        self._logger.error("Error in %s cycle: %s", self.meta.name, e)
                         self._logger.debug(traceback.format_exc())
 
             # Module cleanup
@@ -192,7 +227,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            self._logger.error(f"Fatal error in {self.meta.name} module: {e}")
+            self._logger.error("Fatal error in %s module: %s", self.meta.name, e)
             self._logger.debug(traceback.format_exc())
         finally:
             self._running = False
@@ -210,12 +245,12 @@ class ModuleCore(object, metaclass=IModuleRegistry):
         Gracefully shut down the module.
         """
         if self._running:
-            self._logger.info(f"Shutting down module {self.meta.name}")
+            self._logger.info("Shutting down module %s", self.meta.name)
             self._shutdown_event.set()
             try:
                 await self.cleanup()
             except Exception as e:
-                self._logger.error(f"Error during {self.meta.name} shutdown: {e}")
+                self._logger.error("Error during %s shutdown: %s", self.meta.name, e)
 
     def default_output_topic(self) -> Optional[str]:
         """
@@ -237,7 +272,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
         if hasattr(self._logger, log_level.lower()):
             getattr(self._logger, log_level.lower())(f"[{self.meta.name}] {message}")
         else:
-            self._logger.debug(f"Invalid log level '{log_level}' specified")
+            self._logger.debug("Invalid log level '%s' specified", log_level)
 
     def set_module_arguments(self, arguments: dict) -> None:
         """
@@ -270,7 +305,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
                     self._is_processing = False
             except Exception as e:
                 self._logger.error(
-                    f"Error in {self.meta.name} reactive processing: {e}"
+                    "Error in %s reactive processing: %s", self.meta.name, e
                 )
                 self._logger.debug(traceback.format_exc())
                 self._is_processing = False
@@ -286,7 +321,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
                         self._is_processing = False
                 except Exception as e:
                     self._logger.error(
-                        f"Error in {self.meta.name} reactive processing: {e}"
+                        "Error in %s reactive processing: %s", self.meta.name, e
                     )
                     self._logger.debug(traceback.format_exc())
                     self._is_processing = False
@@ -319,7 +354,7 @@ class ModuleCore(object, metaclass=IModuleRegistry):
         if isinstance(envelope.data, dict):
             self.input_data = envelope.data
         else:
-            self._logger.error(f"Received unexpected data type: {type(envelope.data)}")
+            self._logger.error("Received unexpected data type: %s", type(envelope.data))
 
     async def execute(self, message_bus: MessageBus) -> None:
         """
@@ -1,5 +1,6 @@
 import logging
 import os
+import sys
 import asyncio
 
 from typing import Dict, Optional, List, Any, Set
@@ -12,7 +13,6 @@ from core.modules.util import LogUtil, FileSystem
 from core.modules.util.messagebus import MessageBus
 from core.util.shutdown_coordinator import ShutdownCoordinator
 
-from cryptography.hazmat.primitives import serialization
 from core.security.utils import (
     verify_module,
     get_public_key,
@@ -69,7 +69,8 @@ class ModuleEngine:
         pipeline = self.pipeline_loader.load_pipeline(self.pipeline_name)
         if not pipeline:
             self._logger.error(
-                f"Failed to load pipeline '{self.pipeline_name}'. Cannot start the engine."
+                "Failed to load pipeline '%s'. Cannot start the engine.",
+                self.pipeline_name,
             )
             return False
 
@@ -89,7 +90,7 @@ class ModuleEngine:
         self._build_input_mappings(pipeline.modules)
 
         # Load modules based on the pipeline configuration
-        self._logger.info(f"Loading modules from pipeline '{pipeline.name}'")
+        self._logger.info("Loading modules from pipeline '%s'", pipeline.name)
         self._load_modules(pipeline=pipeline)
 
         # Set module arguments from pipeline
@@ -144,7 +145,7 @@ class ModuleEngine:
             if validation_errors:
                 self._logger.error("Configuration validation failed with errors:")
                 for error in validation_errors:
-                    self._logger.error(f"  - {error}")
+                    self._logger.error("  - %s", error)
 
                 # If --force flag isn't set, return an error
                 if not self.pipeline_options.get("ignore_warnings", False):
@@ -168,10 +169,10 @@ class ModuleEngine:
                         else:
                             f.write("PASSED - all modules configured correctly\n")
                     self._logger.info(
-                        f"Validation results written to {self.output_file}"
+                        "Validation results written to %s", self.output_file
                     )
                 except Exception as e:
-                    self._logger.error(f"Failed to write to output file: {str(e)}")
+                    self._logger.error("Failed to write to output file: %s", e)
 
             return len(validation_errors) == 0 or self.pipeline_options.get(
                 "ignore_warnings", False
@@ -188,7 +189,7 @@ class ModuleEngine:
             timeout = self.pipeline_options.get("timeout", None)
             if timeout is not None:
                 self._logger.info(
-                    f"Setting pipeline execution timeout to {timeout} seconds"
+                    "Setting pipeline execution timeout to %s seconds", timeout
                 )
                 try:
                     # Wait for shutdown with timeout
@@ -197,7 +198,7 @@ class ModuleEngine:
                     )
                 except asyncio.TimeoutError:
                     self._logger.warning(
-                        f"Pipeline execution timed out after {timeout} seconds"
+                        "Pipeline execution timed out after %s seconds", timeout
                     )
                     # Force shutdown
                     self.shutdown_coordinator.trigger_shutdown()
@@ -226,7 +227,7 @@ class ModuleEngine:
 
             return True
         except Exception as e:
-            self._logger.critical(f"Critical error during engine shutdown: {e}")
+            self._logger.critical("Critical error during engine shutdown: %s", e)
             return False
 
     def _load_modules(self, modules=None, pipeline=None):
@@ -262,20 +263,28 @@ class ModuleEngine:
         # Create dictionary to track modules that passed verification
         verified_module_paths = set()
 
-        # First, verify each module before loading it
-        for module_path in module_paths_to_check:
-            full_path = os.path.join(modules_directory, module_path)
+        # First, verify every module concurrently; any prompts below stay sequential
+        full_paths = [
+            os.path.join(modules_directory, module_path)
+            for module_path in module_paths_to_check
+        ]
+        verifications = module_security_manager.verify_modules(full_paths)
+
+        for module_path, full_path in zip(module_paths_to_check, full_paths):
             module_name = os.path.basename(module_path)
 
             # Use the new module_security_manager to verify the module
-            is_allowed = module_security_manager.handle_module_verification(full_path)
+            is_allowed = module_security_manager.handle_module_verification(
+                full_path, verifications[full_path]
+            )
 
             if is_allowed:
-                self._logger.info(f"Module '{module_name}' verification successful")
+                self._logger.info("Module '%s' verification successful", module_name)
                 verified_module_paths.add(module_name)
             else:
                 self._logger.warning(
-                    f"Module '{module_name}' verification failed - will be excluded from execution"
+                    "Module '%s' verification failed - will be excluded from execution",
+                    module_name,
                 )
 
         # Now discover and load only the verified modules
@@ -295,7 +304,7 @@ class ModuleEngine:
         for module in self.use_case.modules:
             if hasattr(module, "meta") and hasattr(module, "initialize_module"):
                 module_name = module.meta.name
-                self._logger.debug(f"Initializing verified module: {module_name}")
+                self._logger.debug("Initializing verified module: %s", module_name)
                 module.initialize_module()
 
     def _build_input_mappings(self, pipeline_modules: List[PipelineModule]) -> None:
@@ -383,7 +392,9 @@ class ModuleEngine:
                 if module_id in self.module_settings:
                     cli_args = self.module_settings[module_id]
                     self._logger.info(
-                        f"Applying CLI settings to module '{module_name}': {cli_args}"
+                        "Applying CLI settings to module '%s': %s",
+                        module_name,
+                        cli_args,
                     )
 
                     # Merge with existing args if any
@@ -403,22 +414,23 @@ class ModuleEngine:
 
             except Exception as e:
                 self._logger.error(
-                    f"Error applying arguments to module '{module_name}': {e}"
+                    "Error applying arguments to module '%s': %s", module_name, e
                 )
 
     def _connect_modules(self):
         """Connect modules based on their inputs and outputs with type validation."""
-        # First register all outputs
+        # Resolve each module's name and configuration once for both passes
+        module_configs = []
         for module in self.use_case.modules:
             module_name = (
                 module.meta.name
                 if hasattr(module, "meta") and module.meta
                 else str(module)
             )
+            module_configs.append((module, module_name, module.get_config()))
 
-            # Get module configuration
-            config = module.get_config()
-
+        # First register all outputs
+        for module, module_name, config in module_configs:
             # Register outputs with the message bus
             if "outputs" in config and config["outputs"]:
                 for output_item in config["outputs"]:
@@ -429,18 +441,12 @@ class ModuleEngine:
                         description=output_item.get("description"),
                     )
                     # Register with message bus
-                    topic = output_def.name
+                    topic = sys.intern(output_def.name)
                     self.message_bus.register_output(topic, output_def, module_name)
 
         # Then connect all inputs, now that outputs are registered
-        for module in self.use_case.modules:
-            module_name = (
-                module.meta.name
-                if hasattr(module, "meta") and module.meta
-                else str(module)
-            )
-            config = module.get_config()
-
+        subscriptions = []
+        for module, module_name, config in module_configs:
             # Process inputs with type validation
             if "inputs" in config and config["inputs"]:
                 for input_item in config["inputs"]:
@@ -470,16 +476,18 @@ class ModuleEngine:
                                 explicit_source = mapping
 
                     # Use the explicit source from input_mapping or default to input name
-                    topic = explicit_source if explicit_source else input_def.name
+                    topic = sys.intern(
+                        explicit_source if explicit_source else input_def.name
+                    )
 
                     # Register the input with the message bus for type validation
                     self.message_bus.register_input(topic, input_def, module_name)
 
                     # Subscribe the module's handle_input method to this topic
                     expected_type = input_def.get_python_type()
-                    self.message_bus.subscribe(
-                        topic, module.handle_input, expected_type
-                    )
+                    subscriptions.append((topic, module.handle_input, expected_type))
+
+        self.message_bus.subscribe_many(subscriptions)
 
     async def _start_modules(self):
         """Start all modules asynchronously and monitor their completion."""
@@ -492,7 +500,7 @@ class ModuleEngine:
                 else str(module)
             )
             try:
-                self._logger.info(f"Starting module: {module_name}")
+                self._logger.info("Starting module: %s", module_name)
 
                 # Create and store the task
                 task = asyncio.create_task(
@@ -503,14 +511,14 @@ class ModuleEngine:
                 # Add a callback to handle task completion
                 task.add_done_callback(
                     lambda t, m=module_name: (
-                        self._logger.info(f"Module {m} task completed")
+                        self._logger.info("Module %s task completed", m)
                         if not t.cancelled()
-                        else self._logger.warning(f"Module {m} task was cancelled")
+                        else self._logger.warning("Module %s task was cancelled", m)
                     )
                 )
 
             except Exception as e:
-                self._logger.error(f"Error starting module {module_name}: {e}")
+                self._logger.error("Error starting module %s: %s", module_name, e)
 
         # Start a task to monitor module completion
         asyncio.create_task(self._monitor_modules())
@@ -24,13 +24,13 @@ class ModuleUseCase:
         Check the state of the loaded module and instantiate it.
         """
         if len(IModuleRegistry.module_registries) > 0:
-            latest_module = IModuleRegistry.module_registries[-1]
+            latest_module = next(reversed(IModuleRegistry.module_registries.values()))
             latest_module_name = latest_module.__module__
             current_module_name = module.__name__
 
             if current_module_name == latest_module_name:
                 self._logger.debug(
-                    f"Successfully imported module `{current_module_name}`"
+                    "Successfully imported module `%s`", current_module_name
                 )
 
                 # Instantiate the module and add it to the list
@@ -38,21 +38,23 @@ class ModuleUseCase:
                     module_instance = latest_module(self._logger, self.thread_pool)
                     self.modules.append(module_instance)
                     self._logger.debug(
-                        f"Module `{current_module_name}` registered successfully"
+                        "Module `%s` registered successfully", current_module_name
                     )
                 except TypeError as e:
                     self._logger.error(
-                        f"Failed to instantiate module `{current_module_name}`: {e}"
+                        "Failed to instantiate module `%s`: %s", current_module_name, e
                     )
             else:
                 self._logger.error(
-                    f"Module import mismatch: expected `{current_module_name}` but got `{latest_module_name}`"
+                    "Module import mismatch: expected `%s` but got `%s`",
+                    current_module_name,
+                    latest_module_name,
                 )
 
             # Clear modules from the registry when we're done with them
             IModuleRegistry.module_registries.clear()
         else:
-            self._logger.error(f"No module found in registry for module: {module}")
+            self._logger.error("No module found in registry for module: %s", module)
 
     def __search_for_modules_in(
         self,
@@ -61,6 +63,11 @@ class ModuleUseCase:
         allowed_modules: Optional[Set[str]] = None,
         excluded_modules: List[str] = None,
     ):
+        # Resolve every module's configuration first so requirements can be
+        # installed in one batch, then import the modules
+        entry_points = []
+        pending_requirements = []
+
         for directory in modules_path:
             # For modules in the pipeline, we need to match only the module name,
             # not the full path including subdirectories
@@ -71,7 +78,7 @@ class ModuleUseCase:
                 mod.lower() for mod in allowed_modules
             }:
                 self._logger.debug(
-                    f"Skipping module {module_name} (not in pipeline configuration)"
+                    "Skipping module %s (not in pipeline configuration)", module_name
                 )
                 continue
 
@@ -80,32 +87,38 @@ class ModuleUseCase:
                 mod.lower() for mod in excluded_modules
             }:
                 self._logger.debug(
-                    f"Skipping module {module_name} (excluded from loading)"
+                    "Skipping module %s (excluded from loading)", module_name
                 )
                 continue
 
             entry_point = self.module_util.setup_module_configuration(
-                package_name, directory
+                package_name, directory, pending_requirements
             )
             if entry_point is not None:
-                module_file, module_ext = os.path.splitext(entry_point)
-                # Construct the full import path relative to the modules_package
-                import_path = os.path.join(directory, module_file)
-                normalized_path = import_path.replace(os.sep, ".")
-                import_target_module = f"{package_name}.{normalized_path}"
-
-                self._logger.debug(f"Importing module: {import_target_module}")
-                try:
-                    module = import_module(import_target_module)
-                    self.__check_loaded_module_state(module)
-                    # Pass module basename as alias for verification
-                    module.alias = module_name
-                except ModuleNotFoundError as e:
-                    self._logger.error(
-                        f"Failed to import module {import_target_module}: {e}"
-                    )
+                entry_points.append((directory, module_name, entry_point))
             else:
-                self._logger.debug(f"No valid module entry point found in {directory}")
+                self._logger.debug("No valid module entry point found in %s", directory)
+
+        # Install every module's missing requirements at once, before any imports
+        self.module_util.install_requirements(package_name, pending_requirements)
+
+        for directory, module_name, entry_point in entry_points:
+            module_file, module_ext = os.path.splitext(entry_point)
+            # Construct the full import path relative to the modules_package
+            import_path = os.path.join(directory, module_file)
+            normalized_path = import_path.replace(os.sep, ".")
+            import_target_module = f"{package_name}.{normalized_path}"
+
+            self._logger.debug("Importing module: %s", import_target_module)
+            try:
+                module = import_module(import_target_module)
+                self.__check_loaded_module_state(module)
+                # Pass module basename as alias for verification
+                module.alias = module_name
+            except ModuleNotFoundError as e:
+                self._logger.error(
+                    "Failed to import module %s: %s", import_target_module, e
+                )
 
     def discover_modules(
         self,
@@ -130,7 +143,7 @@ class ModuleUseCase:
         if reload:
             self.clear_modules()
             self._logger.debug(
-                f"Searching for modules under package {self.modules_package}"
+                "Searching for modules under package %s", self.modules_package
             )
             modules_path = ModuleUtility.filter_modules_paths(self.modules_package)
             package_name = os.path.basename(os.path.normpath(self.modules_package))
@@ -140,7 +153,9 @@ class ModuleUseCase:
             if pipeline:
                 allowed_modules = {module.name for module in pipeline.modules}
                 self._logger.debug(
-                    f"Loading pipeline '{pipeline.name}' modules: {', '.join(allowed_modules)}"
+                    "Loading pipeline '%s' modules: %s",
+                    pipeline.name,
+                    ", ".join(allowed_modules),
                 )
 
                 # If we have excluded modules, remove them from allowed modules
@@ -151,12 +166,14 @@ class ModuleUseCase:
                         m for m in allowed_modules if m.lower() not in excluded_set
                     }
                     self._logger.info(
-                        f"Excluding {len(excluded_set)} unverified modules from loading"
+                        "Excluding %s unverified modules from loading",
+                        len(excluded_set),
                     )
             elif excluded_modules:
                 # If we're not using a pipeline, we'll apply exclusion during module search
                 self._logger.info(
-                    f"Excluding {len(excluded_modules)} unverified modules from loading"
+                    "Excluding %s unverified modules from loading",
+                    len(excluded_modules),
                 )
 
             self.__search_for_modules_in(
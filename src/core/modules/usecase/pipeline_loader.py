@@ -103,12 +103,12 @@ class PipelineLoader:
 
         try:
             # Get all YAML files in the pipeline directory
-            yaml_files = [
-                f
-                for f in os.listdir(pipelines_dir)
-                if os.path.isfile(os.path.join(pipelines_dir, f))
-                and f.endswith(".yaml")
-            ]
+            with os.scandir(pipelines_dir) as entries:
+                yaml_files = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()
+                ]
 
             # Load basic information from each pipeline file
             for yaml_file in yaml_files:
@@ -1,10 +1,11 @@
 import os
+import re
 import subprocess
 import sys
 
 from logging import Logger
 from subprocess import CalledProcessError
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet, Tuple
 
 from importlib.metadata import distributions, PackageNotFoundError  # Updated import
 from dacite import (
@@ -20,16 +21,17 @@ from core.modules.util import FileSystem
 
 
 class ModuleUtility:
-    __IGNORE_LIST = ["__pycache__"]
+    # Directory names never scanned for modules
+    __IGNORE_LIST = frozenset({"__pycache__", ".git", ".venv", "node_modules"})
+    # Names of installed distributions, scanned once and shared by all modules
+    __installed_packages: Optional[FrozenSet[str]] = None
+    # Parsed module configurations keyed by module path: (module.yaml mtime_ns, config)
+    __module_configs: Dict[str, Tuple[int, ModuleConfig]] = {}
 
     def __init__(self, logger: Logger) -> None:
         super().__init__()
         self._logger = logger
 
-    @staticmethod
-    def __filter_unwanted_directories(name: str) -> bool:
-        return not ModuleUtility.__IGNORE_LIST.__contains__(name)
-
     @staticmethod
     def find_all_modules(base_directory: str) -> List[str]:
         """
@@ -45,28 +47,28 @@ class ModuleUtility:
         result = []
 
         def scan_directory(current_path, relative_path=""):
-            # Get all items in the current directory
+            # Get all items in the current directory; scandir hands back the entry
+            # type with the listing, so directories are found without a stat per item
             try:
-                items = os.listdir(current_path)
-                # Filter out unwanted items like __pycache__
-                items = [
-                    item
-                    for item in items
-                    if ModuleUtility.__filter_unwanted_directories(item)
-                ]
-
-                for item in items:
-                    item_path = os.path.join(current_path, item)
-                    item_relative_path = os.path.join(relative_path, item)
-
-                    # If this is a directory, check if it's a module and scan it
-                    if os.path.isdir(item_path):
-                        # If it has module.yaml, it's a module
-                        if os.path.exists(os.path.join(item_path, "module.yaml")):
-                            result.append(item_relative_path)
-
-                        # Continue scanning this directory for more modules
-                        scan_directory(item_path, item_relative_path)
+                with os.scandir(current_path) as entries:
+                    # Keep only directories, skipping unwanted ones like __pycache__
+                    directories = [
+                        entry
+                        for entry in entries
+                        if entry.name not in ModuleUtility.__IGNORE_LIST
+                        and entry.is_dir()
+                    ]
+
+                for entry in directories:
+                    item_path = entry.path
+                    item_relative_path = os.path.join(relative_path, entry.name)
+
+                    # If it has module.yaml, it's a module
+                    if os.path.exists(os.path.join(item_path, "module.yaml")):
+                        result.append(item_relative_path)
+
+                    # Continue scanning this directory for more modules
+                    scan_directory(item_path, item_relative_path)
             except (PermissionError, FileNotFoundError) as e:
                 # Skip directories we can't access
                 pass
@@ -86,9 +88,17 @@ class ModuleUtility:
         """
         return ModuleUtility.find_all_modules(modules_package)
 
+    @staticmethod
+    def __get_installed_packages() -> FrozenSet[str]:
+        if ModuleUtility.__installed_packages is None:
+            ModuleUtility.__installed_packages = frozenset(
+                dist.metadata["Name"] for dist in distributions()
+            )
+        return ModuleUtility.__installed_packages
+
     @staticmethod
     def __get_missing_packages(
-        installed: List[str], required: Optional[List[DependencyModule]]
+        installed: FrozenSet[str], required: Optional[List[DependencyModule]]
     ) -> List[DependencyModule]:
         missing = list()
         if required is not None:
@@ -97,32 +107,94 @@ class ModuleUtility:
                     missing.append(required_pkg)
         return missing
 
-    def __manage_requirements(self, package_name: str, module_config: ModuleConfig):
-        installed_packages: List[str] = [
-            dist.metadata["Name"] for dist in distributions()
-        ]
+    def __manage_requirements(
+        self,
+        package_name: str,
+        module_config: ModuleConfig,
+        pending_requirements: Optional[List[DependencyModule]] = None,
+    ):
         missing_packages = self.__get_missing_packages(
-            installed_packages, module_config.requirements
+            self.__get_installed_packages(), module_config.requirements
+        )
+        if pending_requirements is not None:
+            # Caller installs everything it collected in one go
+            pending_requirements.extend(missing_packages)
+            return
+        self.install_requirements(package_name, missing_packages)
+
+    def __run_pip_install(self, requirements: List[str]) -> int:
+        python = sys.executable
+        exit_code = subprocess.check_call(
+            [python, "-m", "pip", "install", *requirements],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-        for missing in missing_packages:
+        # Rescan installed packages next time they are needed
+        ModuleUtility.__installed_packages = None
+        return exit_code
+
+    def install_requirements(
+        self, package_name: str, packages: List[DependencyModule]
+    ) -> None:
+        """
+        Install missing module requirements with a single pip invocation.
+
+        If the combined install fails, each package is retried on its own so one
+        bad requirement doesn't hold back the rest.
+
+        :param package_name: package the requirements are being installed for
+        :param packages: requirements to install
+        """
+        # Deduplicate while keeping the order modules asked for them in
+        requirements = list(dict.fromkeys(str(package) for package in packages))
+        if not requirements:
+            return
+
+        self._logger.info(
+            "Preparing installation of modules: %s for package: %s",
+            ", ".join(requirements),
+            package_name,
+        )
+        try:
+            exit_code = self.__run_pip_install(requirements)
             self._logger.info(
-                f"Preparing installation of module: {missing} for package: {package_name}"
+                "Installation of modules: %s for package: %s was returned exit code: %s",
+                ", ".join(requirements),
+                package_name,
+                exit_code,
             )
-            try:
-                python = sys.executable
-                exit_code = subprocess.check_call(
-                    [python, "-m", "pip", "install", missing.__str__()],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
+            return
+        except CalledProcessError as e:
+            if len(requirements) == 1:
+                self._logger.error(
+                    "Unable to install package %s: %s", requirements[0], e
                 )
+                return
+            self._logger.warning(
+                "Combined installation failed (%s), installing packages individually", e
+            )
+
+        for requirement in requirements:
+            try:
+                exit_code = self.__run_pip_install([requirement])
                 self._logger.info(
-                    f"Installation of module: {missing} for package: {package_name} was returned exit code: {exit_code}"
+                    "Installation of module: %s for package: %s was returned exit code: %s",
+                    requirement,
+                    package_name,
+                    exit_code,
                 )
             except CalledProcessError as e:
-                self._logger.error(f"Unable to install package {missing}", e)
+                self._logger.error("Unable to install package %s: %s", requirement, e)
 
     def __read_configuration(self, module_path) -> Optional[ModuleConfig]:
         try:
+            # Reuse the parsed config while module.yaml is unchanged; building the
+            # data class is the expensive part of discovery
+            mtime = os.stat(os.path.join(module_path, "module.yaml")).st_mtime_ns
+            cached = ModuleUtility.__module_configs.get(module_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
             module_config_data = FileSystem.load_configuration(
                 "module.yaml", module_path
             )
@@ -141,8 +213,6 @@ class ModuleUtility:
                     if "version" in req:
                         version = req["version"]
                         # Check if version has a constraint prefix like >=, ==, etc.
-                        import re
-
                         match = re.match(r"([>=<~!]+)(.*)", version)
                         if match:
                             constraint, clean_version = match.groups()
@@ -172,9 +242,10 @@ class ModuleUtility:
                         ]  # Copy from type field
 
             module_config = from_dict(data_class=ModuleConfig, data=module_config_data)
+            ModuleUtility.__module_configs[module_path] = (mtime, module_config)
             return module_config
         except FileNotFoundError as e:
-            self._logger.error("Unable to read configuration file", e)
+            self._logger.error("Unable to read configuration file: %s", e)
         except (
             NameError,
             ForwardReferenceError,
@@ -183,36 +254,45 @@ class ModuleUtility:
             MissingValueError,
         ) as e:
             self._logger.error(
-                f"Unable to parse module configuration to data class: {e}"
+                "Unable to parse module configuration to data class: %s", e
             )
         return None
 
-    def setup_module_configuration(self, package_name, module_path) -> Optional[str]:
+    def setup_module_configuration(
+        self,
+        package_name,
+        module_path,
+        pending_requirements: Optional[List[DependencyModule]] = None,
+    ) -> Optional[str]:
         """
         Handles primary configuration for a given package and module
         :param package_name: package of the potential module
         :param module_path: path to the potential module (relative to modules directory)
+        :param pending_requirements: if given, missing requirements are appended here
+            for the caller to install instead of being installed immediately
         :return: a module name to import
         """
-        self._logger.debug(f"Setting up module configuration for {module_path}")
+        self._logger.debug("Setting up module configuration for %s", module_path)
         # Get the full path to the module
         full_module_path = os.path.join(FileSystem.get_modules_directory(), module_path)
 
         if os.path.isdir(full_module_path):
             self._logger.debug(
-                f"Checking if configuration file exists for module: {module_path}"
+                "Checking if configuration file exists for module: %s", module_path
             )
             module_config: Optional[ModuleConfig] = self.__read_configuration(
                 full_module_path
             )
             if module_config is not None:
-                self.__manage_requirements(package_name, module_config)
+                self.__manage_requirements(
+                    package_name, module_config, pending_requirements
+                )
                 return module_config.runtime.main
             else:
                 self._logger.debug(
-                    f"No configuration file exists for module: {module_path}"
+                    "No configuration file exists for module: %s", module_path
                 )
         self._logger.debug(
-            f"Module: {module_path} is not a directory, skipping scanning phase"
+            "Module: %s is not a directory, skipping scanning phase", module_path
         )
         return None
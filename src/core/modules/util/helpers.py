@@ -1,13 +1,23 @@
+import copy
 import logging
 import os
 import sys
 from logging import Logger, StreamHandler, DEBUG
-from typing import Union, Optional
+from typing import Any, Dict, Tuple, Union, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without the libyaml bindings
+    from yaml import SafeLoader
+
 
 class FileSystem:
+    # Parsed YAML files keyed by path: (mtime_ns, parsed data)
+    __yaml_cache: Dict[str, Tuple[int, Any]] = {}
+    # Modules directory found by the fallback search, resolved once per process
+    __modules_directory: Optional[str] = None
 
     @staticmethod
     def __get_base_dir():
@@ -57,7 +67,14 @@ class FileSystem:
         env_module_dir = os.environ.get("MODULE_DIR")
         if env_module_dir:
             return env_module_dir
-        # Fallback logic if env var not set
+        # Fallback logic if env var not set; the search only stats directories that
+        # don't move while running, so it is done once
+        if FileSystem.__modules_directory is None:
+            FileSystem.__modules_directory = FileSystem.__find_modules_directory()
+        return FileSystem.__modules_directory
+
+    @staticmethod
+    def __find_modules_directory() -> str:
         base_dir = FileSystem.__get_base_dir()
         src_modules = os.path.join(base_dir, "src", "modules")
         if os.path.isdir(src_modules):
@@ -95,14 +112,38 @@ class FileSystem:
     ) -> dict:
         if config_directory is None:
             config_directory = FileSystem.__get_config_directory()
-        with open(os.path.join(config_directory, name)) as file:
-            input_data = yaml.safe_load(file)
+        input_data = FileSystem.load_yaml(os.path.join(config_directory, name))
 
         # Dictionary should always be returned, including empty
         if input_data is None:
             return {}
 
-        return input_data
+        # Callers are free to modify their configuration, so hand out a copy
+        return copy.deepcopy(input_data)
+
+    @staticmethod
+    def load_yaml(path: str) -> Any:
+        """
+        Parse a YAML file, reusing the previous result while the file is unchanged.
+
+        The returned object is shared between callers and must not be modified;
+        use load_configuration for a private copy.
+
+        Args:
+            path: Path to the YAML file
+
+        Returns:
+            The parsed YAML data
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = FileSystem.__yaml_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "r", encoding="utf-8") as file:
+            data = yaml.load(file, Loader=SafeLoader)
+        FileSystem.__yaml_cache[path] = (mtime, data)
+        return data
 
 
 class LogUtil(Logger):
@@ -1,7 +1,10 @@
 from collections import defaultdict
 from typing import (
     Dict,
+    Iterable,
     List,
+    Set,
+    Tuple,
     Any,
     Type,
     Callable,
@@ -14,6 +17,7 @@ from typing import (
 import asyncio
 import inspect
 import logging
+import sys
 import traceback
 from core.modules.models import ModuleInput, ModuleOutput, CourierEnvelope
 from core.modules.translation import translator
@@ -33,6 +37,12 @@ class MessageBus:
         self.subscriber_expected_types: Dict[str, Dict[Callable, str]] = defaultdict(
             dict
         )
+        # Per-topic snapshot used by publish: (callback, expected type name, is coroutine)
+        self._dispatch: Dict[
+            str, Tuple[Tuple[Callable, Optional[str], bool], ...]
+        ] = {}
+        # Topics that have already logged a type validation warning
+        self._type_warned_topics: Set[str] = set()
 
     def register_output(
         self, topic: str, output_def: ModuleOutput, source_module: str
@@ -49,15 +59,22 @@ class MessageBus:
             existing_source = self.topic_sources.get(topic, "unknown")
             if existing_source != source_module:
                 self._logger.warning(
-                    f"Topic '{topic}' already registered by module '{existing_source}', "
-                    f"but is also provided by '{source_module}' - this may cause conflicts"
+                    "Topic '%s' already registered by module '%s', "
+                    "but is also provided by '%s' - this may cause conflicts",
+                    topic,
+                    existing_source,
+                    source_module,
                 )
 
+        topic = sys.intern(topic)
         python_type = output_def.get_python_type()
         self.output_types[topic] = python_type
         self.topic_sources[topic] = source_module
         self._logger.debug(
-            f"Registered output topic '{topic}' with type '{output_def.type_name}' from module '{source_module}'"
+            "Registered output topic '%s' with type '%s' from module '%s'",
+            topic,
+            output_def.type_name,
+            source_module,
         )
 
     def register_input(
@@ -83,13 +100,19 @@ class MessageBus:
             ):
                 # Now we log this as a warning instead of an error since we have translation layer
                 self._logger.warning(
-                    f"Type mismatch for topic '{topic}': Module '{target_module}' expects "
-                    f"'{input_def.type_name}' but topic provides '{registered_type.__name__}' - "
-                    f"will attempt automatic translation"
+                    "Type mismatch for topic '%s': Module '%s' expects '%s' but "
+                    "topic provides '%s' - will attempt automatic translation",
+                    topic,
+                    target_module,
+                    input_def.type_name,
+                    registered_type.__name__,
                 )
         else:
             self._logger.warning(
-                f"Module '{target_module}' subscribes to topic '{topic}' that has not been registered as an output"
+                "Module '%s' subscribes to topic '%s' that has not been registered "
+                "as an output",
+                target_module,
+                topic,
             )
 
     def _is_instance_of_type(self, data: Any, expected_type: Type) -> bool:
@@ -127,30 +150,47 @@ class MessageBus:
         If translation fails, the original data is passed through unchanged and a warning
         is logged.
         """
-        if topic not in self.subscribers:
-            self._logger.debug(f"Publishing to topic '{topic}' with no subscribers")
+        subscribers = self._dispatch.get(topic)
+        if not subscribers:
+            self._logger.debug("Publishing to topic '%s' with no subscribers", topic)
             return
 
         # Validate data type if expected type is defined
         expected_type = self.output_types.get(topic)
-        if expected_type:
+        # An exact type match is the common case and needs no generic handling
+        if expected_type and type(data) is not expected_type:
             try:
                 if not self._is_instance_of_type(data, expected_type):
-                    self._logger.warning(
-                        f"Type validation failed: Data published to topic '{topic}' is of type {type(data).__name__}, "
-                        f"expected {getattr(expected_type, '__name__', str(expected_type))} - "
-                        f"proceeding with delivery but subscribers may not be able to process this data"
+                    # Warn once per topic; a mismatched publisher would otherwise
+                    # log on every message
+                    if topic in self._type_warned_topics:
+                        log = self._logger.debug
+                    else:
+                        self._type_warned_topics.add(topic)
+                        log = self._logger.warning
+                    log(
+                        "Type validation failed: Data published to topic '%s' is of type %s, "
+                        "expected %s - proceeding with delivery but subscribers may not be "
+                        "able to process this data",
+                        topic,
+                        type(data).__name__,
+                        getattr(expected_type, "__name__", expected_type),
                     )
                     # Continue with publishing despite validation failure - subscribers may handle it
             except Exception as e:
                 self._logger.warning(
-                    f"Error during type validation for topic '{topic}': {e}, proceeding with delivery"
+                    "Error during type validation for topic '%s': %s, "
+                    "proceeding with delivery",
+                    topic,
+                    e,
                 )
                 # Continue with publishing despite validation error
 
-        # Warn if data is empty
-        if data is None or (isinstance(data, (list, dict, str)) and len(data) == 0):
-            self._logger.debug(f"Empty data published to topic '{topic}'")
+        # Note empty data, but only pay for the check when debug logging is on
+        if self._logger.isEnabledFor(logging.DEBUG) and (
+            data is None or (isinstance(data, (list, dict, str)) and len(data) == 0)
+        ):
+            self._logger.debug("Empty data published to topic '%s'", topic)
 
         # Create a list to collect coroutines for awaiting
         tasks = []
@@ -168,24 +208,20 @@ class MessageBus:
             )
         except Exception as e:
             self._logger.warning(
-                f"Error creating envelope: {e}, using minimal envelope"
+                "Error creating envelope: %s, using minimal envelope", e
             )
             # Create a minimal envelope if the full one fails
             data_type = type(data).__name__ if data is not None else None
             envelope = CourierEnvelope(data=data, topic=topic, data_type=data_type)
 
-        for subscriber in self.subscribers[topic]:
+        for subscriber, subscriber_type, is_async in subscribers:
             try:
                 # Default to using the original envelope
                 subscriber_envelope = envelope
                 was_translated = False
 
-                # Try to get the expected type for this subscriber
+                # Try to translate to the type this subscriber expects
                 try:
-                    subscriber_type = self.subscriber_expected_types.get(topic, {}).get(
-                        subscriber
-                    )
-
                     # Check if translation is needed
                     if (
                         subscriber_type
@@ -212,41 +248,37 @@ class MessageBus:
 
                             if was_translated:
                                 self._logger.debug(
-                                    f"Translated data from {envelope.data_type} to {subscriber_type} "
-                                    f"for topic '{topic}'"
+                                    "Translated data from %s to %s for topic '%s'",
+                                    envelope.data_type,
+                                    subscriber_type,
+                                    topic,
                                 )
                         except Exception as copy_error:
                             # If copying or translation fails, use original envelope
                             self._logger.warning(
-                                f"Error preparing subscriber-specific envelope: {copy_error}, "
-                                f"falling back to original envelope"
+                                "Error preparing subscriber-specific envelope: %s, "
+                                "falling back to original envelope",
+                                copy_error,
                             )
                             subscriber_envelope = envelope
                 except Exception as type_error:
                     # If any error occurs in type lookup/translation setup, use original envelope
                     self._logger.warning(
-                        f"Error in translation preparation: {type_error}, "
-                        f"falling back to original envelope"
+                        "Error in translation preparation: %s, "
+                        "falling back to original envelope",
+                        type_error,
                     )
                     subscriber_envelope = envelope
 
                 # Deliver to subscriber with appropriate error handling
                 try:
                     # Check if the subscriber is a coroutine function
-                    if inspect.iscoroutinefunction(subscriber):
+                    if is_async:
                         # Add coroutine to tasks list with exception handling
-                        async def safe_subscriber_call(sub, env):
-                            try:
-                                return await sub(env)
-                            except Exception as call_error:
-                                self._logger.error(
-                                    f"Error in async subscriber for topic '{topic}': {call_error}\n"
-                                    f"{traceback.format_exc()}"
-                                )
-                                return None
-
                         tasks.append(
-                            safe_subscriber_call(subscriber, subscriber_envelope)
+                            self._safe_subscriber_call(
+                                topic, subscriber, subscriber_envelope
+                            )
                         )
                     else:
                         # Handle synchronous subscribers immediately with error catching
@@ -254,19 +286,24 @@ class MessageBus:
                             subscriber(subscriber_envelope)
                         except Exception as sync_error:
                             self._logger.error(
-                                f"Error in sync subscriber for topic '{topic}': {sync_error}\n"
-                                f"{traceback.format_exc()}"
+                                "Error in sync subscriber for topic '%s': %s\n%s",
+                                topic,
+                                sync_error,
+                                traceback.format_exc(),
                             )
                 except Exception as e:
                     self._logger.error(
-                        f"Critical error delivering to subscriber: {e}\n"
-                        f"{traceback.format_exc()}"
+                        "Critical error delivering to subscriber: %s\n%s",
+                        e,
+                        traceback.format_exc(),
                     )
             except Exception as e:
                 # This is a catch-all for any errors in the entire subscriber handling block
                 self._logger.error(
-                    f"Unexpected error handling subscriber for topic '{topic}': {e}\n"
-                    f"{traceback.format_exc()}"
+                    "Unexpected error handling subscriber for topic '%s': %s\n%s",
+                    topic,
+                    e,
+                    traceback.format_exc(),
                 )
 
         # Wait for all async subscriber tasks to complete with error handling
@@ -274,7 +311,34 @@ class MessageBus:
             try:
                 await asyncio.gather(*tasks, return_exceptions=True)
             except Exception as e:
-                self._logger.error(f"Error gathering async tasks: {e}")
+                self._logger.error("Error gathering async tasks: %s", e)
+
+    async def _safe_subscriber_call(
+        self, topic: str, subscriber: Callable, envelope: CourierEnvelope
+    ) -> Any:
+        """Await an async subscriber, logging rather than raising its errors."""
+        try:
+            return await subscriber(envelope)
+        except Exception as call_error:
+            self._logger.error(
+                "Error in async subscriber for topic '%s': %s\n%s",
+                topic,
+                call_error,
+                traceback.format_exc(),
+            )
+            return None
+
+    def _rebuild_dispatch(self, topic: str) -> None:
+        """Refresh the publish-time snapshot of a topic's subscribers."""
+        expected_types = self.subscriber_expected_types.get(topic, {})
+        self._dispatch[topic] = tuple(
+            (
+                callback,
+                expected_types.get(callback),
+                inspect.iscoroutinefunction(callback),
+            )
+            for callback in self.subscribers[topic]
+        )
 
     def subscribe(
         self,
@@ -283,6 +347,23 @@ class MessageBus:
         expected_type: Optional[Type] = None,
     ) -> None:
         """Subscribe a callback to a topic with optional type validation."""
+        topic = self._add_subscriber(topic, callback, expected_type)
+        self._rebuild_dispatch(topic)
+
+    def _add_subscriber(
+        self,
+        topic: str,
+        callback: Union[Callable, Awaitable],
+        expected_type: Optional[Type],
+    ) -> str:
+        """
+        Record a subscription without refreshing the topic's publish snapshot.
+
+        Returns:
+            The interned topic name the callback was added under
+        """
+        # Interned keys match identifier-like topic literals by identity on publish
+        topic = sys.intern(topic)
         self.subscribers[topic].append(callback)
 
         # Store the expected type for this subscriber for use with translation
@@ -302,14 +383,42 @@ class MessageBus:
                     # Check if translation is possible for this type mismatch
                     if translator.can_convert(output_type_name, expected_type_name):
                         self._logger.info(
-                            f"Type translation will be applied for topic '{topic}': Publisher provides "
-                            f"{output_type_name} but subscriber expects {expected_type_name}"
+                            "Type translation will be applied for topic '%s': "
+                            "Publisher provides %s but subscriber expects %s",
+                            topic,
+                            output_type_name,
+                            expected_type_name,
                         )
                     else:
                         self._logger.warning(
-                            f"Type mismatch for topic '{topic}': Subscriber expects "
-                            f"{expected_type_name} but topic was registered with "
-                            f"{output_type_name} - no translation rule available"
+                            "Type mismatch for topic '%s': Subscriber expects %s but "
+                            "topic was registered with %s - no translation rule available",
+                            topic,
+                            expected_type_name,
+                            output_type_name,
                         )
             else:
                 self.output_types[topic] = expected_type
+
+        return topic
+
+    def subscribe_many(
+        self,
+        subscriptions: Iterable[
+            Tuple[str, Union[Callable, Awaitable], Optional[Type]]
+        ],
+    ) -> None:
+        """
+        Subscribe several callbacks in one call.
+
+        Each affected topic's publish snapshot is rebuilt once, after all of the
+        subscriptions have been recorded.
+
+        Args:
+            subscriptions: (topic, callback, expected_type) tuples, applied in order
+        """
+        topics = set()
+        for topic, callback, expected_type in subscriptions:
+            topics.add(self._add_subscriber(topic, callback, expected_type))
+        for topic in topics:
+            self._rebuild_dispatch(topic)
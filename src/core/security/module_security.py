@@ -2,19 +2,39 @@ import os
 import logging
 import hashlib
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, Tuple, Optional, List
 from pathlib import Path
 
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.exceptions import InvalidSignature
-
-from .trusted_signers import trusted_signers_manager
+from .trusted_signers import trusted_signers_manager, verify_with_public_key
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Read size for the streaming fallback used when hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _update_hash_from_file(sha256, file) -> None:
+    """
+    Feed the remaining contents of a binary file object into a running hash.
+
+    Args:
+        sha256: Hash object to update in place
+        file: File object opened in binary mode
+    """
+    if hasattr(hashlib, "file_digest"):
+        # file_digest streams straight into OpenSSL; handing it the running hash
+        # keeps the digest identical to hashing the concatenated file contents
+        hashlib.file_digest(file, lambda: sha256)
+        return
+
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    while size := file.readinto(buffer):
+        sha256.update(view[:size])
+
 
 class SecurityMode(Enum):
     """Security modes for module verification."""
@@ -45,6 +65,8 @@ class ModuleSecurityManager:
     def __init__(self):
         self.security_mode = SecurityMode.DEFAULT
         self.allow_unverified = False
+        # Hash computed for each module path by its most recent verification
+        self._module_hashes: Dict[str, str] = {}
 
     def set_security_mode(self, mode: str) -> bool:
         """
@@ -60,7 +82,7 @@ class ModuleSecurityManager:
             self.security_mode = SecurityMode(mode.lower())
             return True
         except ValueError:
-            logger.error(f"Invalid security mode: {mode}")
+            logger.error("Invalid security mode: %s", mode)
             return False
 
     def set_allow_unverified(self, allow: bool):
@@ -79,7 +101,7 @@ class ModuleSecurityManager:
         """
         try:
             if not os.path.isdir(module_path):
-                logger.error(f"Module path is not a directory: {module_path}")
+                logger.error("Module path is not a directory: %s", module_path)
                 return None
 
             sha256 = hashlib.sha256()
@@ -102,16 +124,32 @@ class ModuleSecurityManager:
             # Hash each file's content
             for file_path in files:
                 try:
-                    with open(file_path, "rb") as f:
-                        sha256.update(f.read())
+                    # Unbuffered: both hashing paths read into their own buffer
+                    with open(file_path, "rb", buffering=0) as f:
+                        _update_hash_from_file(sha256, f)
                 except Exception as e:
-                    logger.warning(f"Failed to read file for hashing: {file_path}: {e}")
+                    logger.warning("Failed to read file for hashing: %s: %s", file_path, e)
 
             return sha256.hexdigest()
         except Exception as e:
-            logger.error(f"Error computing module hash for {module_path}: {e}")
+            logger.error("Error computing module hash for %s: %s", module_path, e)
             return None
 
+    def get_module_hash(self, module_path: str) -> Optional[str]:
+        """
+        Get a module's hash, reusing the one from its last verification if available.
+
+        Args:
+            module_path: Path to the module directory
+
+        Returns:
+            Hash as a hex string, or None if error
+        """
+        module_hash = self._module_hashes.get(module_path)
+        if module_hash is None:
+            module_hash = self.compute_module_hash(module_path)
+        return module_hash
+
     def read_signature_file(self, module_path: str) -> Optional[bytes]:
         """
         Read the module's signature file.
@@ -124,14 +162,14 @@ class ModuleSecurityManager:
         """
         sig_file_path = os.path.join(module_path, "module.sig")
         if not os.path.exists(sig_file_path):
-            logger.debug(f"No signature file found for module: {module_path}")
+            logger.debug("No signature file found for module: %s", module_path)
             return None
 
         try:
             with open(sig_file_path, "rb") as f:
                 return f.read()
         except Exception as e:
-            logger.error(f"Failed to read signature file for {module_path}: {e}")
+            logger.error("Failed to read signature file for %s: %s", module_path, e)
             return None
 
     def verify_module(
@@ -148,23 +186,26 @@ class ModuleSecurityManager:
         """
         try:
             if not os.path.isdir(module_path):
-                logger.warning(f"Cannot verify non-existent module path: {module_path}")
+                logger.warning("Cannot verify non-existent module path: %s", module_path)
                 return ModuleVerificationStatus.ERROR, None
 
             # Step 1: Check for signature file
             signature = self.read_signature_file(module_path)
             if not signature:
-                logger.debug(f"Module has no signature file: {module_path}")
+                logger.debug("Module has no signature file: %s", module_path)
                 return ModuleVerificationStatus.UNSIGNED, None
 
             # Step 2: Compute module hash
             module_hash = self.compute_module_hash(module_path)
             if not module_hash:
-                logger.error(f"Failed to compute hash for module: {module_path}")
+                logger.error("Failed to compute hash for module: %s", module_path)
                 return ModuleVerificationStatus.ERROR, None
 
+            self._module_hashes[module_path] = module_hash
+
             # Step 3: Find which signer signed this module
-            hash_bytes = module_hash.encode("utf-8")
+            # (signatures cover the ASCII hex digest, so this is a plain encode)
+            hash_bytes = module_hash.encode("ascii")
             signer_id = trusted_signers_manager.find_signature_signer(
                 hash_bytes, signature
             )
@@ -172,12 +213,16 @@ class ModuleSecurityManager:
             # Step 4: Determine verification status
             if signer_id:
                 logger.info(
-                    f"Module '{os.path.basename(module_path)}' verified with trusted signer: {signer_id}"
+                    "Module '%s' verified with trusted signer: %s",
+                    os.path.basename(module_path),
+                    signer_id,
                 )
                 return ModuleVerificationStatus.VERIFIED, signer_id
 
             # Try to verify with any known signature format
             # This is to handle the case where the module is signed but not by a trusted signer
+            from cryptography.exceptions import InvalidSignature
+
             for signer_id in trusted_signers_manager.get_all_trusted_signers():
                 public_key = trusted_signers_manager.get_public_key(signer_id)
                 if not public_key:
@@ -185,14 +230,10 @@ class ModuleSecurityManager:
 
                 try:
                     # Just detect if the signature is valid without checking the data
-                    public_key.verify(
+                    verify_with_public_key(
+                        public_key,
                         signature,
                         b"dummy data to see if signature matches format",
-                        padding.PSS(
-                            mgf=padding.MGF1(hashes.SHA256()),
-                            salt_length=padding.PSS.MAX_LENGTH,
-                        ),
-                        hashes.SHA256(),
                     )
                     # We should never reach here as the verification should fail for wrong data
                     pass
@@ -201,7 +242,8 @@ class ModuleSecurityManager:
                     # It means we found the format, so this might be an untrusted signer
                     # Extract potential signer info from the signature
                     logger.warning(
-                        f"Module '{os.path.basename(module_path)}' has a valid signature format but is not from a trusted signer"
+                        "Module '%s' has a valid signature format but is not from a trusted signer",
+                        os.path.basename(module_path),
                     )
                     return ModuleVerificationStatus.SIGNED_UNTRUSTED, None
                 except Exception:
@@ -209,14 +251,37 @@ class ModuleSecurityManager:
                     pass
 
             logger.warning(
-                f"Module '{os.path.basename(module_path)}' has an invalid signature"
+                "Module '%s' has an invalid signature", os.path.basename(module_path)
             )
             return ModuleVerificationStatus.INVALID, None
 
         except Exception as e:
-            logger.error(f"Error verifying module {module_path}: {e}")
+            logger.error("Error verifying module %s: %s", module_path, e)
             return ModuleVerificationStatus.ERROR, None
 
+    def verify_modules(
+        self, module_paths: List[str]
+    ) -> Dict[str, Tuple[ModuleVerificationStatus, Optional[str]]]:
+        """
+        Verify several modules concurrently.
+
+        Hashing and signature checks both release the GIL, so spreading them over
+        a thread pool lets the disk reads and RSA work of different modules overlap.
+
+        Args:
+            module_paths: Paths to the module directories
+
+        Returns:
+            Dictionary mapping each module path to its (verification_status, signer_id)
+        """
+        if len(module_paths) <= 1:
+            return {path: self.verify_module(path) for path in module_paths}
+
+        max_workers = min(32, (os.cpu_count() or 1) + 4, len(module_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.verify_module, module_paths)
+            return dict(zip(module_paths, results))
+
     def prompt_user_for_module(
         self, module_path: str, status: ModuleVerificationStatus
     ) -> bool:
@@ -236,7 +301,7 @@ class ModuleSecurityManager:
         if self.security_mode == SecurityMode.PARANOID:
             if status != ModuleVerificationStatus.VERIFIED:
                 logger.warning(
-                    f"Module '{module_name}' blocked in paranoid mode: {status.value}"
+                    "Module '%s' blocked in paranoid mode: %s", module_name, status.value
                 )
                 return False
             return True
@@ -245,7 +310,7 @@ class ModuleSecurityManager:
         if self.security_mode == SecurityMode.PERMISSIVE:
             if status != ModuleVerificationStatus.VERIFIED:
                 logger.warning(
-                    f"Running unverified module '{module_name}': {status.value}"
+                    "Running unverified module '%s': %s", module_name, status.value
                 )
             return True
 
@@ -253,7 +318,9 @@ class ModuleSecurityManager:
         if self.allow_unverified:
             if status != ModuleVerificationStatus.VERIFIED:
                 logger.warning(
-                    f"Running unverified module '{module_name}' (--allow-unverified): {status.value}"
+                    "Running unverified module '%s' (--allow-unverified): %s",
+                    module_name,
+                    status.value,
                 )
             return True
 
@@ -282,17 +349,17 @@ class ModuleSecurityManager:
 
             if choice in ("y", "yes"):
                 logger.info(
-                    f"User allowed untrusted module '{module_name}' for this run"
+                    "User allowed untrusted module '%s' for this run", module_name
                 )
                 return True
 
             if choice in ("n", "no"):
-                logger.info(f"User declined to run untrusted module '{module_name}'")
+                logger.info("User declined to run untrusted module '%s'", module_name)
                 return False
 
             if choice == "always":
                 logger.info(
-                    f"User allowed untrusted module '{module_name}' permanently"
+                    "User allowed untrusted module '%s' permanently", module_name
                 )
                 # Setting the allow_unverified flag for this session
                 self.allow_unverified = True
@@ -300,22 +367,29 @@ class ModuleSecurityManager:
 
             print("Invalid choice. Please enter 'yes', 'no', or 'always'.")
 
-    def handle_module_verification(self, module_path: str) -> bool:
+    def handle_module_verification(
+        self,
+        module_path: str,
+        verification: Optional[Tuple[ModuleVerificationStatus, Optional[str]]] = None,
+    ) -> bool:
         """
         Handle the verification of a module and user interaction.
 
         Args:
             module_path: Path to the module directory
+            verification: Result of an earlier verify_module call, if already known
 
         Returns:
             True if module is allowed to run, False otherwise
         """
-        status, signer_id = self.verify_module(module_path)
+        if verification is None:
+            verification = self.verify_module(module_path)
+        status, signer_id = verification
 
         if status == ModuleVerificationStatus.VERIFIED:
             # Module is verified by a trusted signer
             logger.info(
-                f"Module '{os.path.basename(module_path)}' verified by {signer_id}"
+                "Module '%s' verified by %s", os.path.basename(module_path), signer_id
             )
             return True
 
@@ -2,13 +2,13 @@ import os
 import json
 import logging
 import base64
+import functools
 from typing import Dict, Optional, Tuple
 
 from pathlib import Path
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
-from cryptography.hazmat.primitives import hashes
-from cryptography.exceptions import InvalidSignature
+
+# cryptography is imported where it is used, so runs that only see unsigned
+# modules never pay for loading it
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -17,6 +17,64 @@ logger = logging.getLogger(__name__)
 TRUSTED_SIGNERS_FILE = "src/settings/trusted_signers.json"
 
 
+def signature_fits_key(public_key, signature: bytes) -> bool:
+    """
+    Check whether a signature has the length a public key's scheme produces.
+
+    Args:
+        public_key: Loaded public key
+        signature: Signature to check
+
+    Returns:
+        False if the key cannot have produced the signature, True otherwise
+    """
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return len(signature) == 64
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return len(signature) == (public_key.key_size + 7) // 8
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _rsa_pss_parameters():
+    """Build the RSA-PSS padding and SHA-256 hash objects once and reuse them."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    algorithm = hashes.SHA256()
+    pss = padding.PSS(
+        mgf=padding.MGF1(algorithm),
+        salt_length=padding.PSS.MAX_LENGTH,
+    )
+    return pss, algorithm
+
+
+def verify_with_public_key(public_key, signature: bytes, data: bytes) -> None:
+    """
+    Verify a signature with a signer's public key, whatever its key type.
+
+    Ed25519 keys verify the data directly; RSA keys use PSS padding with SHA-256.
+
+    Args:
+        public_key: Loaded public key
+        signature: Signature to verify
+        data: Data that was signed
+
+    Raises:
+        InvalidSignature: If the signature does not match the data
+    """
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        public_key.verify(signature, data)
+        return
+
+    pss, algorithm = _rsa_pss_parameters()
+    public_key.verify(signature, data, pss, algorithm)
+
+
 class TrustedSignersManager:
     """
     Manages trusted signers for module verification.
@@ -28,6 +86,8 @@ class TrustedSignersManager:
     def __init__(self, signers_file_path: str = TRUSTED_SIGNERS_FILE):
         self.signers_file_path = signers_file_path
         self.signers = self._load_trusted_signers()
+        # Parsed public keys, keyed by signer and stored with the PEM they came from
+        self._public_keys: Dict[str, Tuple[str, object]] = {}
 
     def _load_trusted_signers(self) -> Dict:
         """
@@ -47,7 +107,7 @@ class TrustedSignersManager:
                 data = json.load(f)
             return data
         except Exception as e:
-            logger.error(f"Failed to load trusted signers file: {e}")
+            logger.error("Failed to load trusted signers file: %s", e)
             return {}
 
     def save_trusted_signers(self) -> bool:
@@ -66,7 +126,7 @@ class TrustedSignersManager:
                 json.dump(self.signers, f, indent=2)
             return True
         except Exception as e:
-            logger.error(f"Failed to save trusted signers file: {e}")
+            logger.error("Failed to save trusted signers file: %s", e)
             return False
 
     def get_public_key(self, signer_id: str):
@@ -81,19 +141,26 @@ class TrustedSignersManager:
         """
         try:
             if signer_id not in self.signers:
-                logger.warning(f"Signer not found: {signer_id}")
+                logger.warning("Signer not found: %s", signer_id)
                 return None
 
             signer_data = self.signers[signer_id]
             if "pubkey" not in signer_data:
-                logger.warning(f"Public key not found for signer: {signer_id}")
+                logger.warning("Public key not found for signer: %s", signer_id)
                 return None
 
             pubkey_pem = signer_data["pubkey"]
+            cached = self._public_keys.get(signer_id)
+            if cached is not None and cached[0] == pubkey_pem:
+                return cached[1]
+
+            from cryptography.hazmat.primitives import serialization
+
             public_key = serialization.load_pem_public_key(pubkey_pem.encode("utf-8"))
+            self._public_keys[signer_id] = (pubkey_pem, public_key)
             return public_key
         except Exception as e:
-            logger.error(f"Failed to load public key for {signer_id}: {e}")
+            logger.error("Failed to load public key for %s: %s", signer_id, e)
             return None
 
     def verify_signature(self, data: bytes, signature: bytes, signer_id: str) -> bool:
@@ -112,22 +179,16 @@ class TrustedSignersManager:
         if not public_key:
             return False
 
+        from cryptography.exceptions import InvalidSignature
+
         try:
-            public_key.verify(
-                signature,
-                data,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
-            )
+            verify_with_public_key(public_key, signature, data)
             return True
         except InvalidSignature:
-            logger.warning(f"Invalid signature from signer {signer_id}")
+            logger.warning("Invalid signature from signer %s", signer_id)
             return False
         except Exception as e:
-            logger.error(f"Error verifying signature from {signer_id}: {e}")
+            logger.error("Error verifying signature from %s: %s", signer_id, e)
             return False
 
     def add_trusted_signer(
@@ -145,16 +206,19 @@ class TrustedSignersManager:
             True if added successfully, False otherwise
         """
         try:
+            from cryptography.hazmat.primitives import serialization
+
             # Validate the public key first
-            serialization.load_pem_public_key(pubkey.encode("utf-8"))
+            public_key = serialization.load_pem_public_key(pubkey.encode("utf-8"))
 
             # Add to trusted signers
             self.signers[signer_id] = {"pubkey": pubkey, "comment": comment}
+            self._public_keys[signer_id] = (pubkey, public_key)
 
             # Save the updated list
             return self.save_trusted_signers()
         except Exception as e:
-            logger.error(f"Failed to add trusted signer {signer_id}: {e}")
+            logger.error("Failed to add trusted signer %s: %s", signer_id, e)
             return False
 
     def remove_trusted_signer(self, signer_id: str) -> bool:
@@ -172,9 +236,10 @@ class TrustedSignersManager:
 
         try:
             del self.signers[signer_id]
+            self._public_keys.pop(signer_id, None)
             return self.save_trusted_signers()
         except Exception as e:
-            logger.error(f"Failed to remove trusted signer {signer_id}: {e}")
+            logger.error("Failed to remove trusted signer %s: %s", signer_id, e)
             return False
 
     def get_all_trusted_signers(self) -> Dict:
@@ -198,6 +263,11 @@ class TrustedSignersManager:
             Signer ID if found and verified, None otherwise
         """
         for signer_id in self.signers:
+            # Skip keys that could never have produced a signature of this length,
+            # rather than paying for a full verification against each of them
+            public_key = self.get_public_key(signer_id)
+            if public_key is None or not signature_fits_key(public_key, signature):
+                continue
             if self.verify_signature(data, signature, signer_id):
                 return signer_id
         return None
@@ -3,7 +3,7 @@ import os
 import logging
 from typing import Dict
 
-from .module_security import module_security_manager
+from .module_security import ModuleVerificationStatus, module_security_manager
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -19,14 +19,14 @@ def load_verified_modules() -> Dict:
     verified_file = "src/settings/verified_modules.json"
     try:
         if not os.path.exists(verified_file):
-            logger.warning(f"Verified modules file not found: {verified_file}")
+            logger.warning("Verified modules file not found: %s", verified_file)
             return {"modules": {}}
 
         with open(verified_file, "r", encoding="utf-8") as f:
             data = json.load(f)
         return data
     except Exception as e:
-        logger.error(f"Failed to load verified modules file: {e}")
+        logger.error("Failed to load verified modules file: %s", e)
         return {"modules": {}}
 
 
@@ -49,33 +49,36 @@ def get_module_verification_status(modules_directory: str = None) -> Dict[str, b
 
     status = {}
 
-    # Find all module directories
+    # Find all module directories and verify them together
     try:
-        for item in os.listdir(modules_directory):
-            module_path = os.path.join(modules_directory, item)
-            if os.path.isdir(module_path):
-                verification_status, signer_id = module_security_manager.verify_module(
-                    module_path
-                )
+        with os.scandir(modules_directory) as entries:
+            module_dirs = {entry.name: entry.path for entry in entries if entry.is_dir()}
+
+        results = module_security_manager.verify_modules(list(module_dirs.values()))
+
+        for item, module_path in module_dirs.items():
+            verification_status, signer_id = results[module_path]
 
-                # Convert to boolean for simple API
-                is_verified = (
-                    verification_status
-                    == module_security_manager.ModuleVerificationStatus.VERIFIED
+            # Convert to boolean for simple API
+            is_verified = verification_status == ModuleVerificationStatus.VERIFIED
+            status[item] = is_verified
+
+            # Log appropriate message
+            if is_verified:
+                logger.debug(
+                    "Module '%s' verification status: %s, signer: %s",
+                    item,
+                    is_verified,
+                    signer_id,
+                )
+            else:
+                logger.warning(
+                    "Module '%s' verification failed - status: %s",
+                    item,
+                    verification_status.value,
                 )
-                status[item] = is_verified
-
-                # Log appropriate message
-                if is_verified:
-                    logger.debug(
-                        f"Module '{item}' verification status: {is_verified}, signer: {signer_id}"
-                    )
-                else:
-                    logger.warning(
-                        f"Module '{item}' verification failed - status: {verification_status.value}"
-                    )
     except Exception as e:
-        logger.error(f"Error checking module verification status: {e}")
+        logger.error("Error checking module verification status: %s", e)
 
     return status
 
@@ -93,7 +96,7 @@ def verify_module(module_path: str, public_key=None) -> bool:
     """
     status, _ = module_security_manager.verify_module(module_path)
     # Return True only for VERIFIED status
-    return status == module_security_manager.ModuleVerificationStatus.VERIFIED
+    return status == ModuleVerificationStatus.VERIFIED
 
 
 def get_public_key():
@@ -1,8 +1,14 @@
 import logging
+import time
 import yaml
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without the libyaml bindings
+    from yaml import SafeLoader
+
 
 class ColorFormatter(logging.Formatter):
     """
@@ -29,20 +35,50 @@ class ColorFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None, style="%", use_color=True):
         super().__init__(fmt, datefmt, style)
         self.use_color = use_color
+        # Level names never change, so pad and color the standard ones up front
+        self._level_names = {
+            level: self._format_level_name(level) for level in self.COLOR_CODES
+        }
+        # (second, date format, formatted time) of the last timestamp produced
+        self._time_cache = (None, None, "")
+
+    def _format_level_name(self, level: str) -> str:
+        """Pad a level name to a fixed width, colored if this formatter uses color."""
+        level_name = level.ljust(self.LEVEL_WIDTH)
+        if not self.use_color:
+            return level_name
+        log_color = self.COLOR_CODES.get(level, self.RESET_CODE)
+        return f"{self.BOLD_CODE}{log_color}{level_name}{self.RESET_CODE}"
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        """
+        Format the record's creation time, calling strftime at most once per second.
+
+        Records logged within the same second share the formatted date and time,
+        only the milliseconds are filled in per record.
+        """
+        datefmt = datefmt or self.datefmt
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(
+                datefmt or self.default_time_format, self.converter(second)
+            )
+            self._time_cache = (second, datefmt, formatted)
+
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
 
     def format(self, record: logging.LogRecord) -> str:
-        # Format level name with fixed width
-        level_name = record.levelname.ljust(self.LEVEL_WIDTH)
-        # Format logger name with fixed width
-        logger_name = record.name[: self.NAME_WIDTH].ljust(self.NAME_WIDTH)
+        # Fixed-width (and colored) level name, precomputed for standard levels
+        levelname = self._level_names.get(record.levelname)
+        if levelname is None:
+            levelname = self._format_level_name(record.levelname)
 
         location = f"[{record.filename}:{record.lineno}]".ljust(self.LOCATION_WIDTH)
 
         if self.use_color:
-            # Apply color to the log level
-            log_color = self.COLOR_CODES.get(record.levelname, self.RESET_CODE)
-            levelname = f"{self.BOLD_CODE}{log_color}{level_name}{self.RESET_CODE}"
-
             # Apply toned-down color to the timestamp
             timestamp = f"{self.DIM_CODE}{self.formatTime(record)}{self.RESET_CODE}"
 
@@ -50,15 +86,13 @@ class ColorFormatter(logging.Formatter):
             location = f"{self.BOLD_CODE}{self.DIM_CODE}{location}{self.RESET_CODE}"
         else:
             # Plain text formatting for file logs
-            levelname = level_name
             timestamp = self.formatTime(record)
-            location = location
 
         # Default formatting for the message
         message = record.getMessage()
 
         # Combine all parts into the final formatted string
-        return f"{timestamp} {levelname} {location} {message}"
+        return " ".join((timestamp, levelname, location, message))
 
 
 def configure_logging(
@@ -69,7 +103,7 @@ def configure_logging(
     Uses a single formatter style with optional color support.
     """
     with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
 
     log_config = config.get("logging", {})
     if log_level is None:
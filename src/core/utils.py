@@ -7,6 +7,9 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Root of the data directory, relative to the working directory
+DATA_DIR = Path("data")
+
 def get_platform_info():
     """Get information about the current platform in a standardized way"""
     return {
@@ -21,9 +24,7 @@ def get_platform_info():
 def ensure_data_dir(subdir=None):
     """Ensure data directory exists and return path"""
     # Use Path for cross-platform compatibility
-    base_path = Path("data")
-    if subdir:
-        base_path = base_path / subdir
+    base_path = DATA_DIR / subdir if subdir else DATA_DIR
     
     # Create directory if it doesn't exist
     base_path.mkdir(parents=True, exist_ok=True)
@@ -38,7 +39,7 @@ def save_json(data, filename, subdir=None):
     with open(file_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, default=str)
     
-    logger.debug(f"Data saved to {file_path}")
+    logger.debug("Data saved to %s", file_path)
     return file_path
 
 def load_json(filename, subdir=None):
@@ -47,13 +48,13 @@ def load_json(filename, subdir=None):
     file_path = data_dir / filename
     
     if not file_path.exists():
-        logger.warning(f"File not found: {file_path}")
+        logger.warning("File not found: %s", file_path)
         return None
     
     with open(file_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
-    logger.debug(f"Data loaded from {file_path}")
+    logger.debug("Data loaded from %s", file_path)
     return data
 
 def timestamp_filename(prefix="data", extension="json"):
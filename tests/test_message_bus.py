@@ -67,3 +67,31 @@ def test_module_core():
     assert isinstance(module, ModuleCore)
     assert hasattr(module, "meta")
     assert hasattr(module, "_shutdown_event")
+
+
+@pytest.mark.asyncio
+async def test_message_bus_subscribe_many():
+    bus = MessageBus()
+
+    results = []
+
+    def first(envelope):
+        results.append(("first", envelope.data))
+
+    def second(envelope):
+        results.append(("second", envelope.data))
+
+    bus.subscribe_many([("test_topic", first, str), ("test_topic", second, None)])
+
+    assert bus.subscribers["test_topic"] == [first, second]
+    await bus.publish("test_topic", "Hello")
+    assert results == [("first", "Hello"), ("second", "Hello")]
+
+    # Later subscriptions are picked up by publish as well
+    bus.subscribe("test_topic", first)
+    await bus.publish("test_topic", "World")
+    assert results[-3:] == [
+        ("first", "World"),
+        ("second", "World"),
+        ("first", "World"),
+    ]
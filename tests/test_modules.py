@@ -172,3 +172,103 @@ def test_module_engine_build_input_mappings():
     assert engine.input_mappings["target_module"] == {
         "target_input": "source.source_output"
     }
+
+
+def test_verify_modules_matches_serial_verification(tmp_path):
+    """Test that concurrent module verification gives the same results as verifying one at a time."""
+    from core.security.module_security import (
+        ModuleVerificationStatus,
+        module_security_manager,
+    )
+
+    module_paths = []
+    for name in ("alpha", "beta", "gamma"):
+        module_dir = tmp_path / name
+        module_dir.mkdir()
+        (module_dir / "module.yaml").write_text(f"name: {name}\n")
+        module_paths.append(str(module_dir))
+
+    # Give one module a signature that no trusted signer produced
+    (tmp_path / "beta" / "module.sig").write_bytes(b"\x00" * 256)
+
+    results = module_security_manager.verify_modules(module_paths)
+
+    assert list(results) == module_paths
+    for path in module_paths:
+        assert results[path] == module_security_manager.verify_module(path)
+    assert results[str(tmp_path / "alpha")][0] == ModuleVerificationStatus.UNSIGNED
+    assert results[str(tmp_path / "beta")][0] != ModuleVerificationStatus.VERIFIED
+
+
+def test_module_registry_replaces_reregistered_class():
+    """Test that registering a module class under an existing key replaces it instead of duplicating it."""
+    from core.modules.engine import IModuleRegistry, ModuleCore
+
+    def define_module():
+        class RegistryProbeModule(ModuleCore):
+            pass
+
+        return RegistryProbeModule
+
+    key = f"{__name__}.RegistryProbeModule"
+    try:
+        first = define_module()
+        second = define_module()
+
+        assert first is not second
+        assert IModuleRegistry.module_registries[key] is second
+        assert next(reversed(IModuleRegistry.module_registries.values())) is second
+        assert list(IModuleRegistry.module_registries).count(key) == 1
+    finally:
+        IModuleRegistry.module_registries.pop(key, None)
+
+
+def test_module_config_is_private_to_each_instance(tmp_path):
+    """Test that a module editing its config doesn't change the config other instances see."""
+    from core.modules.engine import IModuleRegistry, ModuleCore
+
+    (tmp_path / "module.yaml").write_text(
+        "name: config_probe\noutputs:\n  - name: probe_out\n", encoding="utf-8"
+    )
+
+    class ConfigProbeModule(ModuleCore):
+        pass
+
+    ConfigProbeModule._module_dir = str(tmp_path)
+    try:
+        first = ConfigProbeModule(Mock(), None)
+        first.get_config()["outputs"].append({"name": "added"})
+        first.get_config()["name"] = "changed"
+
+        second = ConfigProbeModule(Mock(), None)
+        assert second.meta.name == "config_probe"
+        assert second.get_config()["outputs"] == [{"name": "probe_out"}]
+    finally:
+        IModuleRegistry.module_registries.pop(f"{__name__}.ConfigProbeModule", None)
+
+
+def test_trusted_signer_verifies_ed25519_signatures(tmp_path):
+    """Test that Ed25519 signer keys are accepted alongside RSA ones."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+    from core.security.trusted_signers import TrustedSignersManager
+
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    pubkey_pem = (
+        private_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode("utf-8")
+    )
+
+    manager = TrustedSignersManager(str(tmp_path / "trusted_signers.json"))
+    assert manager.add_trusted_signer("ed25519_signer", pubkey_pem)
+
+    data = b"0123456789abcdef"
+    signature = private_key.sign(data)
+
+    assert manager.verify_signature(data, signature, "ed25519_signer")
+    assert not manager.verify_signature(b"tampered", signature, "ed25519_signer")
+    assert manager.find_signature_signer(data, signature) == "ed25519_signer"